@@ -1,6 +1,8 @@
 """Support for LG soundbars."""
 from __future__ import annotations
 
+from collections import deque
+
 import temescal
 
 from homeassistant.components.media_player import (
@@ -10,8 +12,26 @@ from homeassistant.components.media_player import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+
+# Delay used to coalesce the burst of responses sent after a refresh
+WRITE_DEBOUNCE = 0.05
+
+
+def _reverse_index(names: list[str]) -> dict[str, int]:
+    """Map each name to its first index, matching list.index."""
+    index: dict[str, int] = {}
+    for position, name in enumerate(names):
+        index.setdefault(name, position)
+    return index
+
+
+FUNCTION_INDEX = _reverse_index(temescal.functions)
+EQUALISER_INDEX = _reverse_index(temescal.equalisers)
+NUM_FUNCTIONS = len(temescal.functions)
+NUM_EQUALISERS = len(temescal.equalisers)
 
 
 async def async_setup_entry(
@@ -53,9 +73,13 @@ class LGDevice(MediaPlayerEntity):
         self._volume_min = 0
         self._volume_max = 0
         self._function = -1
+        self._source: str | None = None
         self._functions = []
+        self._source_list: list[str] | None = None
         self._equaliser = -1
+        self._sound_mode: str | None = None
         self._equalisers = []
+        self._sound_mode_list: list[str] | None = None
         self._mute = 0
         self._rear_volume = 0
         self._rear_volume_min = 0
@@ -66,70 +90,156 @@ class LGDevice(MediaPlayerEntity):
         self._bass = 0
         self._treble = 0
         self._device = None
+        self._unsub_write: CALLBACK_TYPE | None = None
+        self._responses: deque[dict] = deque()
+        self._drain_pending = False
+        self._dispatch = {
+            "EQ_VIEW_INFO": self.handle_eq_view_info_event,
+            "SPK_LIST_VIEW_INFO": self.handle_spk_list_view_info_event,
+            "FUNC_VIEW_INFO": self.handle_func_view_info_event,
+            "SETTING_VIEW_INFO": self.handle_setting_view_info_event,
+        }
 
     async def async_added_to_hass(self) -> None:
         """Register the callback after hass is ready for it."""
         await self.hass.async_add_executor_job(self._connect)
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel any pending state write."""
+        if self._unsub_write is not None:
+            self._unsub_write()
+            self._unsub_write = None
+
     def _connect(self) -> None:
         """Perform the actual devices setup."""
         self._device = temescal.temescal(
-            self._host, port=self._port, callback=self.handle_event
+            self._host, port=self._port, callback=self._handle_event_threadsafe
         )
         self._device.get_product_info()
         self._device.get_mac_info()
-        self.update()
+        self._initial_refresh()
+
+    def _handle_event_threadsafe(self, response):
+        """Pass responses from the temescal listener thread to the loop."""
+        self._responses.append(response)
+        if not self._drain_pending:
+            self._drain_pending = True
+            self.hass.loop.call_soon_threadsafe(self._async_drain_responses)
+
+    @callback
+    def _async_drain_responses(self) -> None:
+        """Handle all responses queued since the last loop hop."""
+        # Clear the flag first so a response queued while draining
+        # schedules another hop instead of being left behind.
+        self._drain_pending = False
+        while self._responses:
+            self.handle_event(self._responses.popleft())
 
+    @callback
     def handle_event(self, response):
         """Handle responses from the speakers."""
-        data = response["data"]
-        if response["msg"] == "EQ_VIEW_INFO":
-            if "i_bass" in data:
-                self._bass = data["i_bass"]
-            if "i_treble" in data:
-                self._treble = data["i_treble"]
-            if "ai_eq_list" in data:
-                self._equalisers = data["ai_eq_list"]
-            if "i_curr_eq" in data:
-                self._equaliser = data["i_curr_eq"]
-        elif response["msg"] == "SPK_LIST_VIEW_INFO":
-            if "i_vol" in data:
-                self._volume = data["i_vol"]
-            if "i_vol_min" in data:
-                self._volume_min = data["i_vol_min"]
-            if "i_vol_max" in data:
-                self._volume_max = data["i_vol_max"]
-            if "b_mute" in data:
-                self._mute = data["b_mute"]
-            if "i_curr_func" in data:
-                self._function = data["i_curr_func"]
-        elif response["msg"] == "FUNC_VIEW_INFO":
-            if "i_curr_func" in data:
-                self._function = data["i_curr_func"]
-            if "ai_func_list" in data:
-                self._functions = data["ai_func_list"]
-        elif response["msg"] == "SETTING_VIEW_INFO":
-            if "i_rear_min" in data:
-                self._rear_volume_min = data["i_rear_min"]
-            if "i_rear_max" in data:
-                self._rear_volume_max = data["i_rear_max"]
-            if "i_rear_level" in data:
-                self._rear_volume = data["i_rear_level"]
-            if "i_woofer_min" in data:
-                self._woofer_volume_min = data["i_woofer_min"]
-            if "i_woofer_max" in data:
-                self._woofer_volume_max = data["i_woofer_max"]
-            if "i_woofer_level" in data:
-                self._woofer_volume = data["i_woofer_level"]
-            if "i_curr_eq" in data:
-                self._equaliser = data["i_curr_eq"]
-            if "s_user_name" in data:
-                self._attr_name = data["s_user_name"]
-
-        self.schedule_update_ha_state()
-
-    def update(self) -> None:
-        """Trigger updates from the device."""
+        previous = self._state_snapshot()
+        if (handler := self._dispatch.get(response["msg"])) is not None:
+            handler(response["data"])
+        if self._state_snapshot() != previous:
+            self._async_schedule_write()
+
+    def handle_eq_view_info_event(self, data):
+        """Handle EQ_VIEW_INFO responses."""
+        self._bass = data.get("i_bass", self._bass)
+        self._treble = data.get("i_treble", self._treble)
+        if (equalisers := data.get("ai_eq_list")) is not None and (
+            equalisers != self._equalisers
+        ):
+            self._equalisers = equalisers
+            self._sound_mode_list = None
+        if "i_curr_eq" in data:
+            self._set_equaliser(data["i_curr_eq"])
+
+    def handle_spk_list_view_info_event(self, data):
+        """Handle SPK_LIST_VIEW_INFO responses."""
+        self._volume = data.get("i_vol", self._volume)
+        self._volume_min = data.get("i_vol_min", self._volume_min)
+        self._volume_max = data.get("i_vol_max", self._volume_max)
+        self._mute = data.get("b_mute", self._mute)
+        if "i_curr_func" in data:
+            self._set_function(data["i_curr_func"])
+        if (status := data.get("b_powerstatus")) is not None:
+            self._attr_state = MediaPlayerState.ON if status else MediaPlayerState.OFF
+
+    def handle_func_view_info_event(self, data):
+        """Handle FUNC_VIEW_INFO responses."""
+        if "i_curr_func" in data:
+            self._set_function(data["i_curr_func"])
+        if (functions := data.get("ai_func_list")) is not None and (
+            functions != self._functions
+        ):
+            self._functions = functions
+            self._source_list = None
+
+    def handle_setting_view_info_event(self, data):
+        """Handle SETTING_VIEW_INFO responses."""
+        self._rear_volume_min = data.get("i_rear_min", self._rear_volume_min)
+        self._rear_volume_max = data.get("i_rear_max", self._rear_volume_max)
+        self._rear_volume = data.get("i_rear_level", self._rear_volume)
+        self._woofer_volume_min = data.get("i_woofer_min", self._woofer_volume_min)
+        self._woofer_volume_max = data.get("i_woofer_max", self._woofer_volume_max)
+        self._woofer_volume = data.get("i_woofer_level", self._woofer_volume)
+        if "i_curr_eq" in data:
+            self._set_equaliser(data["i_curr_eq"])
+        if "s_user_name" in data:
+            self._attr_name = data["s_user_name"]
+
+    def _set_function(self, function: int) -> None:
+        """Store the current function and resolve its source name."""
+        if function == self._function:
+            return
+        self._function = function
+        if 0 <= function < NUM_FUNCTIONS:
+            self._source = temescal.functions[function]
+        else:
+            self._source = None
+
+    def _set_equaliser(self, equaliser: int) -> None:
+        """Store the current equaliser and resolve its sound mode name."""
+        if equaliser == self._equaliser:
+            return
+        self._equaliser = equaliser
+        if 0 <= equaliser < NUM_EQUALISERS:
+            self._sound_mode = temescal.equalisers[equaliser]
+        else:
+            self._sound_mode = None
+
+    def _state_snapshot(self) -> tuple:
+        """Return the values that are visible in the entity state."""
+        return (
+            self._volume,
+            self._volume_max,
+            self._mute,
+            self._function,
+            self._functions,
+            self._equaliser,
+            self._equalisers,
+            self._attr_state,
+            self.name,
+        )
+
+    @callback
+    def _async_schedule_write(self) -> None:
+        """Schedule a single state write for a burst of responses."""
+        if self._unsub_write is None:
+            self._unsub_write = async_call_later(
+                self.hass, WRITE_DEBOUNCE, self._async_flush_write
+            )
+
+    @callback
+    def _async_flush_write(self, _now) -> None:
+        """Write the state once the burst of responses has settled."""
+        self._unsub_write = None
+        self.async_write_ha_state()
+
+    def _initial_refresh(self) -> None:
+        """Request a full snapshot, later changes are pushed by the device."""
         self._device.get_eq()
         self._device.get_info()
         self._device.get_func()
@@ -150,48 +260,52 @@ class LGDevice(MediaPlayerEntity):
     @property
     def sound_mode(self):
         """Return the current sound mode."""
-        if self._equaliser == -1 or self._equaliser >= len(temescal.equalisers):
-            return None
-        return temescal.equalisers[self._equaliser]
+        return self._sound_mode
 
     @property
     def sound_mode_list(self):
         """Return the available sound modes."""
-        modes = []
-        for equaliser in self._equalisers:
-            if equaliser < len(temescal.equalisers):
-                modes.append(temescal.equalisers[equaliser])
-        return sorted(modes)
+        if self._sound_mode_list is None:
+            self._sound_mode_list = sorted(
+                temescal.equalisers[equaliser]
+                for equaliser in self._equalisers
+                if equaliser < len(temescal.equalisers)
+            )
+        return self._sound_mode_list
 
     @property
     def source(self):
         """Return the current input source."""
-        if self._function == -1 or self._function >= len(temescal.functions):
-            return None
-        return temescal.functions[self._function]
+        return self._source
 
     @property
     def source_list(self):
         """List of available input sources."""
-        sources = []
-        for function in self._functions:
-            if function < len(temescal.functions):
-                sources.append(temescal.functions[function])
-        return sorted(sources)
+        if self._source_list is None:
+            self._source_list = sorted(
+                temescal.functions[function]
+                for function in self._functions
+                if function < len(temescal.functions)
+            )
+        return self._source_list
 
     def set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
-        volume = volume * self._volume_max
-        self._device.set_volume(int(volume))
+        target = int(volume * self._volume_max)
+        if target == self._volume:
+            return
+        self._device.set_volume(target)
 
     def mute_volume(self, mute: bool) -> None:
         """Mute (true) or unmute (false) media player."""
+        if bool(mute) == bool(self._mute):
+            return
         self._device.set_mute(mute)
 
     def select_source(self, source: str) -> None:
         """Select input source."""
-        self._device.set_func(temescal.functions.index(source))
+        self._device.set_func(FUNCTION_INDEX[source])
 
     def select_sound_mode(self, sound_mode: str) -> None:
         """Set Sound Mode for Receiver.."""
-        self._device.set_eq(temescal.equalisers.index(sound_mode))
+        self._device.set_eq(EQUALISER_INDEX[sound_mode])